@@ -10,6 +10,8 @@ DEBOUNCE_SECONDS: int = 10
 ICLOUD_REFRESH_SECONDS: int = 90
 UPLOAD_WORKERS: int = 1
 DOWNLOAD_WORKERS: int = 32
+ICLOUD_WORKERS: int = 32
+FOLDER_BATCH_SIZE: int = 50
 NETWORK_RETRY_SECONDS: int = 120
 
 class ExitCode(Enum):
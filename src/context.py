@@ -24,5 +24,6 @@ class Context:
     icloud_refresh_period: timedelta
     debounce_period: timedelta
     max_workers: int
+    icloud_workers: int
     timeloop: any
     jobs_disabled: TimedEvent
@@ -246,6 +246,12 @@ class EventHandler(FileSystemEventHandler):
                 logger.warning(traceback.format_exc())
                 self.ctx.jobs_disabled.set()
 
+    def close(self) -> None:
+        """
+        Release resources held by the event handler at process exit.
+        """
+        self._icloud.close()
+
     def _nanny(self):
         """runs periodically"""
         current_thread().name = "nanny"
@@ -259,6 +265,8 @@ class EventHandler(FileSystemEventHandler):
         """
         Called by timeloop periodically to refresh iCloud Drive tree if the refresh
         period has elapsed. Does not run if a forced refresh was recently performed.
+        The periodic refresh is not skipped when is_dirty() reports no change, the
+        file and item counts it probes stay the same when a file is edited or renamed.
         """
         current_thread().name = "refresh_icloud"
 
@@ -274,10 +282,22 @@ class EventHandler(FileSystemEventHandler):
                         self._event_queue.qsize())
                     sleep(self.ctx.debounce_period.total_seconds()+5)
 
+                # log in before taking the locks, a re-login can take a while
+                refresh: ICloudTree = ICloudTree(ctx=self.ctx)
+                try:
+                    authenticated: bool = refresh.authenticate()
+                except Exception as e:
+                    logger.warning("caught exception %s authenticating refresh", e)
+                    logger.warning(traceback.format_exc())
+                    logger.info("pausing jobs")
+                    self.ctx.jobs_disabled.set()
+                    authenticated = False
+                if not authenticated:
+                    logger.error("unable to authenticate, will retry later")
+                    return
                 with self._refresh_lock, self._pending_futures:
                     # We have the locks
                     logger.debug("refreshing iCloud")
-                    refresh: ICloudTree = ICloudTree(ctx=self.ctx)
                     start = datetime.now()
                     if refresh.refresh():
                         logger.debug(
@@ -637,8 +657,7 @@ class EventHandler(FileSystemEventHandler):
                 if full_path.is_file():
                     full_path.unlink()
                     files_deleted = 1
-            if path in self._local.keys():
-                self._local.pop(path=path)
+            self._local.pop(path=path)
         return files_deleted, folders_deleted
 
     def _handle_file_created(self, event: ICDSFileCreatedEvent) -> None:
@@ -763,8 +782,7 @@ class EventHandler(FileSystemEventHandler):
             logger.warning("local file/folder %s reappeared after file delete", event.src_path)
             return
 
-        if event.src_path in self._local.keys():
-            self._local.pop(event.src_path)
+        self._local.pop(event.src_path)
 
         parent_path: Path = event.src_path.parent
         parent: ICloudFolderInfo = self._icloud.get(parent_path, None)
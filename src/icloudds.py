@@ -4,7 +4,6 @@ Creates arrays of regexes from include/ignore files
 Checks sanity of command line parameters
 Creates instance of timeloop at global scope, so we can remove its logger later
 """
-import os
 import sys
 import logging
 from datetime import timedelta
@@ -106,7 +105,13 @@ def load_regexes(name: str) -> list[str] | None:
               help="Maximum number of concurrent workers",
               type=click.IntRange(min=1),
               metavar="<workers>",
-              default=os.cpu_count(),
+              default=constants.DOWNLOAD_WORKERS,
+              show_default=True)
+@click.option("--icloud-workers",
+              help="Number of concurrent workers used to scan iCloud Drive",
+              type=click.IntRange(min=1),
+              metavar="<workers>",
+              default=constants.ICLOUD_WORKERS,
               show_default=True)
 @version_option(version=importlib.metadata.version(NAME))
 #@version_option()
@@ -122,7 +127,8 @@ def main(directory: str,
          icloud_check_period: int,
          icloud_refresh_period: int,
          debounce_period: int,
-         max_workers: int
+         max_workers: int,
+         icloud_workers: int
          ) -> int:
     """
     Synchronize a local folder with your iCloud Drive
@@ -145,6 +151,7 @@ def main(directory: str,
     lock_file = Path(tempfile.gettempdir()).joinpath(tempfile.gettempdir(), "icloudds.lock")
     lock: InterProcessLock = InterProcessLock(lock_file)
     if lock.acquire(blocking=False):
+        event_handler: EventHandler = None
         try:
 
             context = Context(directory=directory,
@@ -159,6 +166,7 @@ def main(directory: str,
                             icloud_refresh_period=timedelta(seconds=icloud_refresh_period),
                             debounce_period=timedelta(seconds=debounce_period),
                             max_workers=max_workers,
+                            icloud_workers=icloud_workers,
                             timeloop=timeloop,
                             jobs_disabled=TimedEvent(constants.NETWORK_RETRY_SECONDS))
 
@@ -183,6 +191,8 @@ def main(directory: str,
             logger.critical("exception in main thread: %s %s", e.__class__.__name__, e)
             logger.critical(traceback.format_exc())
         finally:
+            if event_handler is not None:
+                event_handler.close()
             lock.release()
             if lock_file.exists():
                 lock_file.unlink()
@@ -9,7 +9,9 @@ from pathlib import Path
 import logging
 from logging import Logger
 import re
-from collections.abc import Iterator
+from threading import Lock, Event
+from concurrent.futures import Future
+from collections.abc import Iterable, Iterator
 from typing import Any, Tuple
 
 from context import Context
@@ -56,6 +58,53 @@ class BaseTree():
         self._includes_regexes: list[re.Pattern] = [
             re.compile(pattern) for pattern in include_regexes]
 
+        # what ignore() matches against, one alternation per list so a path is scanned once
+        self._ignore_matchers: list[re.Pattern] = BaseTree._combine(builtin_ignore_regexes)
+        self._include_matchers: list[re.Pattern] = BaseTree._combine(include_regexes)
+
+        # refresh tasks submitted and not yet finished, _walk_done is set at zero
+        self._inflight_lock: Lock = Lock()
+        self._inflight: int = 0
+        self._walk_done: Event = Event()
+        self._walk_errors: list[BaseException] = []
+
+    @staticmethod
+    def _combine(patterns: list[str]) -> list[re.Pattern]:
+        """
+        Compile patterns into a single alternation, or each on its own if they
+        cannot be combined: a pattern with groups would have its backreference
+        numbers shifted, and global inline flags are only valid at the start.
+        """
+        compiled: list[re.Pattern] = [re.compile(pattern) for pattern in patterns]
+        if len(compiled) < 2 or any(matcher.groups for matcher in compiled):
+            return compiled
+        try:
+            return [re.compile("|".join(f"(?:{pattern})" for pattern in patterns))]
+        except re.error:
+            return compiled
+
+    def _track(self, future: Future) -> Future:
+        """
+        Count future as in flight until it is done, see refresh().
+        """
+        with self._inflight_lock:
+            self._inflight += 1
+            self._walk_done.clear()
+        future.add_done_callback(self._untrack)
+        return future
+
+    def _untrack(self, future: Future) -> None:
+        """
+        Done callback for futures passed to _track, keeps the exceptions
+        for refresh() to raise and signals when nothing is left in flight.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            self._walk_errors.append(future.exception())
+        with self._inflight_lock:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._walk_done.set()
+
     @property
     def document_root(self):
         """return document root"""
@@ -66,7 +115,7 @@ class BaseTree():
         root = self._root if root else self._trash
         return root.keys()
 
-    def items(self, root:bool=True) -> Iterator[Tuple[str, Any]]:
+    def items(self, root:bool=True) -> Iterable[Tuple[Path, Any]]:
         """returns items in root or trash"""
         root = self._root if root else self._trash
         return root.items()
@@ -137,14 +186,8 @@ class BaseTree():
 
     def prune(self, path: Path, inclusive:bool=True) -> None:
         """prunes all sub-paths from tree, and path if inclusive"""
-        for k in self.keys():
-            p: Path = Path(k)
-            if p.is_relative_to(path):
-                if not inclusive and p == path:
-                    continue
-                with self._root as root:
-                    if k in root:
-                        root.pop(k)
+        self._root.bulk_pop([k for k in self.keys()
+                             if k.is_relative_to(path) and (inclusive or k != path)])
 
     def re_key(self, old_path: Path, new_path: Path) -> None:
         """re-keys old_path to new_path including children"""
@@ -172,15 +215,16 @@ class BaseTree():
         Returns:
             True if the item should be ignored, False otherwise.
         """
-        for regex in self._ignore_regexes:
-            if re.match(regex, path.as_posix()):
+        name: str = path.as_posix()
+        for regex in self._ignore_matchers:
+            if regex.match(name):
                 return True
 
-        if not self._includes_regexes:
+        if not self._include_matchers:
             return False
 
-        for regex in self._includes_regexes:
-            if re.match(regex, path.as_posix()):
+        for regex in self._include_matchers:
+            if regex.match(name):
                 return False
 
         return True
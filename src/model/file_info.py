@@ -19,6 +19,7 @@ class BaseInfo:
     Base class for file and folder information objects.
     Provides common utility methods for handling timestamps across different platforms.
     """
+    __slots__ = ()
 
     def _round_seconds(self, dt: datetime) -> datetime:
         """
@@ -39,14 +40,16 @@ class FolderInfo(BaseInfo):
     Base class for folder information.
     Extends BaseInfo with folder-specific functionality.
     """
+    __slots__ = ()
 
 class FileInfo(BaseInfo):
     """
     Base class for file information.
     Extends BaseInfo with file-specific functionality including size and modification time.
     """
+    __slots__ = ()
 
-@dataclass
+@dataclass(slots=True)
 class LocalFolderInfo(FolderInfo):
     """
     Represents a local folder stored on the file system.
@@ -58,7 +61,7 @@ class LocalFolderInfo(FolderInfo):
         """Return string representation of the local folder."""
         return f"FolderInfo({self.name})"
 
-@dataclass
+@dataclass(slots=True)
 class LocalFileInfo(FileInfo):
     """
     Represents a local file stored on the file system.
@@ -97,7 +100,7 @@ class LocalFileInfo(FileInfo):
         """Return string representation of the local file with size and modification time."""
         return f"FileInfo({self.name}, size={self.size}, modified={self.modified_time})"
 
-@dataclass
+@dataclass(slots=True)
 class ICloudFolderInfo(FolderInfo):
     """
     Represents a folder in iCloud Drive.
@@ -140,7 +143,7 @@ class ICloudFolderInfo(FolderInfo):
         """Return string representation of the iCloud folder."""
         return f"FolderInfo({self.name})"
 
-@dataclass
+@dataclass(slots=True)
 class ICloudFileInfo(FileInfo):
     """
     Represents a file in iCloud Drive.
@@ -8,10 +8,13 @@ file operations (upload, download, delete, rename), and change detection.
 import os
 from pathlib import Path
 import logging
+from threading import Lock
 import traceback
 from typing import Callable, override
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from concurrent.futures import ThreadPoolExecutor, Future
 
+import orjson
+from requests.adapters import HTTPAdapter
 from urllib3 import disable_warnings
 from urllib3.exceptions import InsecureRequestWarning
 from pyicloud import PyiCloudService
@@ -70,6 +73,10 @@ class ICloudTree(BaseTree):
     3. REFRESH OPERATION:
     - Refreshes both root and trash folders recursively using multi-threaded processing
     - Uses ThreadPoolExecutor for concurrent folder processing to improve performance
+    - Each task lists a batch of up to 50 sibling folders in one request and submits one task
+      per batch of their subfolders, so the walk fans out across the pool and runs as many
+      listings as there are workers (--icloud-workers)
+    - Listings are network bound, workers wait on sockets with the GIL released
     - Validates the tree by checking file counts and detecting mismatches
     - Applies ignore/include rules to filter out items as specified in context
 
@@ -93,19 +100,56 @@ class ICloudTree(BaseTree):
     7. THREAD MANAGEMENT:
     - Updates thread names for better debugging and monitoring
     - Supports concurrent processing of folders and file operations
+    - A single, lazily created thread pool is shared by all ICloudTree instances
+      and is shut down by close() at process exit
     - Thread-safe folder traversal during refresh operations
     """
     first_time = True
+    _shared_threadpool: ThreadPoolExecutor = None
+    _shared_threadpool_lock: Lock = Lock()
+    # every refresh builds a new tree, logins are serialized across all of them as they
+    # share the cookie and session files and may prompt for a 2FA code
+    _auth_lock: Lock = Lock()
+    # info class for each DriveNode type kept in the tree, other types are skipped
+    _child_info_classes: dict[str, type[ICloudFileInfo | ICloudFolderInfo]] = {
+        "folder": ICloudFolderInfo,
+        "file": ICloudFileInfo,
+    }
 
     def __init__(self, ctx: Context) -> ICloudTree:
         self.drive: DriveService = None
         self._is_authenticated: bool = False
+        self._auth_epoch: int = 0
         self.ctx: Context = ctx
-        self._threadpool: ThreadPoolExecutor = ThreadPoolExecutor(
-            thread_name_prefix='refresh',
-            max_workers=max((os.cpu_count() or 1) * 4, constants.DOWNLOAD_WORKERS))
+        # running totals of items added by process_folder, reset by refresh
+        self._counts_lock: Lock = Lock()
+        self._file_count_root: int = 0
+        self._file_count_trash: int = 0
+        self._folder_count_root: int = 0
+        self._folder_count_trash: int = 0
         super().__init__(ctx)
 
+    @property
+    def _threadpool(self) -> ThreadPoolExecutor:
+        """
+        Return the thread pool used to scan iCloud Drive, creating it on first use.
+        The pool is shared by all ICloudTree instances (a new tree is built for every
+        background refresh) and lives until close() is called.
+        """
+        with ICloudTree._shared_threadpool_lock:
+            if ICloudTree._shared_threadpool is None:
+                ICloudTree._shared_threadpool = ThreadPoolExecutor(
+                    thread_name_prefix='icloud',
+                    max_workers=self.ctx.icloud_workers)
+            return ICloudTree._shared_threadpool
+
+    def close(self) -> None:
+        """Shut down the shared iCloud Drive thread pool, waiting for running tasks."""
+        with ICloudTree._shared_threadpool_lock:
+            if ICloudTree._shared_threadpool is not None:
+                ICloudTree._shared_threadpool.shutdown(wait=True)
+                ICloudTree._shared_threadpool = None
+
     @override
     @property
     def document_root(self):
@@ -118,28 +162,44 @@ class ICloudTree(BaseTree):
         """
         Authenticate with iCloud using provided credentials.
         Caches the authentication state to avoid redundant logins.
+        Only one thread in the process logs in at a time, others wait and
+        reuse the result when it is for the same tree.
+        Each successful login bumps the authentication epoch.
         """
         if self._is_authenticated:
             return True
-        try:
-            api: PyiCloudService = authenticate(
-                username=self.ctx.username,
-                password=self.ctx.password,
-                cookie_directory=self.ctx.cookie_directory,
-                raise_authorization_exception=False,
-                client_id=None,
-                unverified_https=True
-                )
-            self.drive: DriveService = api.drive
-            self._is_authenticated: bool = True
-            if ICloudTree.first_time:
-                logger.info("iCloud Drive is %s@%s", self.ctx.username, self.drive.service_root)
-                ICloudTree.first_time = False
-            return True
-        except PyiCloudFailedLoginException as e:
-            logger.error("exception in authenticate %s", e)
-            self._handle_drive_exception(e)
+        error: PyiCloudFailedLoginException = None
+        with self._auth_lock:
+            if self._is_authenticated:
+                return True
+            # pyicloud loads the cookie jar itself and saves it after every request, so
+            # there is nothing stable to cache here, the lock keeps re-logins to one at a time
+            try:
+                api: PyiCloudService = authenticate(
+                    username=self.ctx.username,
+                    password=self.ctx.password,
+                    cookie_directory=self.ctx.cookie_directory,
+                    raise_authorization_exception=False,
+                    client_id=None,
+                    unverified_https=True
+                    )
+                self.drive: DriveService = api.drive
+                # the default adapter keeps 10 connections per host, size the pool for every
+                # worker that can be talking to iCloud so keep-alive sockets are reused
+                pool_size: int = max(self.ctx.icloud_workers, self.ctx.max_workers)
+                self.drive.session.mount("https://", HTTPAdapter(pool_connections=pool_size,
+                                                                 pool_maxsize=pool_size))
+                self._auth_epoch += 1
+                self._is_authenticated: bool = True
+                if ICloudTree.first_time:
+                    logger.info("iCloud Drive is %s@%s", self.ctx.username, self.drive.service_root)
+                    ICloudTree.first_time = False
+                return True
+            except PyiCloudFailedLoginException as e:
+                logger.error("exception in authenticate %s", e)
+                error = e
 
+        self._handle_drive_exception(error)
         return False
 
     @override
@@ -151,41 +211,44 @@ class ICloudTree(BaseTree):
         Applies ignore/include rules to filter items.
         Validates the tree by checking file counts."""
         succeeded: bool = True
+        epoch: int = None
         try:
             if not self.authenticate():
                 logger.error("unable to authenticate, will retry later")
                 return False
+            epoch = self._auth_epoch
             self._root.clear()
             self._trash.clear()
             self._root[BaseTree.ROOT_FOLDER_NAME] = ICloudFolderInfo(node=self.drive.root)
             self._trash[BaseTree.ROOT_FOLDER_NAME] = ICloudFolderInfo(node=self.drive.trash)
-
-            with self._threadpool as executor:
-                pending = set()
-                for root in [True, False]:
-                    logger.debug("refreshing iCloud Drive %s", "root" if root else "trash")
-                    future = executor.submit(
-                        self.process_folder,
-                        root=root,
-                        path=BaseTree.ROOT_FOLDER_NAME,
-                        recursive=True,
-                        ignore=False,
-                        executor=executor
-                        )
-                    pending = pending | set([future])
-                while pending:
-                    done, pending = as_completed(pending), set()
-                    for future in done:
-                        new_futures = future.result()
-                        if (isinstance(new_futures, list)
-                            and all(isinstance(f, Future) for f in new_futures)
-                            ):
-                            pending.update(new_futures)
-
-            root_files_count = sum(1 for _ in self.files(root=True))
-            trash_files_count = sum(1 for _ in self.files(root=False))
-            if self._root_count() != root_files_count + trash_files_count:
-                raise MismatchException(f"mismatch root_count: {self._root_count()} "
+            with self._counts_lock:
+                self._file_count_root = self._file_count_trash = 0
+                self._folder_count_root = self._folder_count_trash = 1
+
+            executor: ThreadPoolExecutor = self._threadpool
+            self._walk_errors.clear()
+            for root in [True, False]:
+                logger.debug("refreshing iCloud Drive %s", "root" if root else "trash")
+                self._track(executor.submit(
+                    self.process_folder,
+                    root=root,
+                    path=BaseTree.ROOT_FOLDER_NAME,
+                    recursive=True,
+                    ignore=False,
+                    executor=executor
+                    ))
+            # every task registers its subfolder tasks before it finishes itself,
+            # so the count only reaches zero once the whole walk is done
+            self._walk_done.wait()
+            if self._walk_errors:
+                raise self._walk_errors[0]
+
+            # counted as the walk added files, no pass over the trees is needed to check them
+            root_count: int = self._root_count()
+            root_files_count: int = self._file_count_root
+            trash_files_count: int = self._file_count_trash
+            if root_count != root_files_count + trash_files_count:
+                raise MismatchException(f"mismatch root_count: {root_count} "
                                         f"!= root_files_count: {root_files_count} +"
                                         f" trash_files_count: {trash_files_count}")
         except MismatchException:
@@ -194,21 +257,22 @@ class ICloudTree(BaseTree):
             succeeded = False
         except Exception as e:
             logger.warning("caught exception %s in refresh()", e)
-            self._handle_drive_exception(e)
+            self._handle_drive_exception(e, epoch)
             succeeded = False
 
-        logger.debug("refresh iCloud Drive complete root has %d items, "
-                     "root count %d, %d folders, %d files",
-                     len(self._root),
-                     self._root_count(),
-                     sum(1 for _ in self.folders(root=True)),
-                     sum(1 for _ in self.files(root=True)))
-        logger.debug("refresh iCloud Drive complete trash has %d items, "
-                     "trash count %d, %d folders, %d files",
-                     len(self._trash),
-                     self._trash_count(),
-                     sum(1 for _ in self.folders(root=False)),
-                     sum(1 for _ in self.files(root=False)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("refresh iCloud Drive complete root has %d items, "
+                         "root count %d, %d folders, %d files",
+                         len(self._root),
+                         self._root_count(),
+                         self._folder_count_root,
+                         self._file_count_root)
+            logger.debug("refresh iCloud Drive complete trash has %d items, "
+                         "trash count %d, %d folders, %d files",
+                         len(self._trash),
+                         self._trash_count(),
+                         self._folder_count_trash,
+                         self._file_count_trash)
         self._remove_ignored_items()
         return succeeded
 
@@ -229,79 +293,152 @@ class ICloudTree(BaseTree):
                        path: Path=None,
                        recursive: bool=False,
                        ignore: bool=True,
-                       executor: ThreadPoolExecutor=None) -> Refresh | list[Future]:
+                       executor: ThreadPoolExecutor=None,
+                       prefetched: bool=False) -> Refresh | list[Future]:
         """
         Process a folder in iCloud Drive, populating its children in the tree structure.
         Can be run recursively to process subfolders.
         Supports multi-threaded execution using ThreadPoolExecutor.
         Applies ignore/include rules as specified.
+        When recursive, subfolders are handed out in batches to _process_folder_batch, one
+        Future per batch, which fetches their children with a single request.
         Returns a list of Future objects for further processing or a Refresh.
         """
         _the_dict: ThreadSafePathDict = self._root if root else self._trash
         futures: list[Future] = []
         children: list[DriveNode] = []
         result: ActionResult = Refresh(path=path, success=True)
-        cfi: ICloudFolderInfo = _the_dict.get(path, None)
+        # the folder was added before this task was submitted, no need to lock to find it
+        cfi: ICloudFolderInfo = _the_dict.unsafe_get(path, None)
+        additions: dict[Path, ICloudFileInfo | ICloudFolderInfo] = {}
+        folders: list[Path] = []
 
         if cfi is None:
             result: Nil = Nil()
         else:
-            children = _the_dict[path].node.get_children(force=True)
-
+            children = cfi.node.get_children(force=not prefetched)
+
+        # the parent is the same for every child, choose how to build child paths once,
+        # each key is built once per refresh and a Path keeps its parsed parts and hash
+        join_child: Callable[[str], Path] = (
+            Path if path == BaseTree.ROOT_FOLDER_NAME else path.joinpath)
+        # ignore() is called per child, its patterns are combined once by BaseTree and
+        # matching a batch of paths joined by newlines could let a pattern span two paths
         for child in children:
-            if path == BaseTree.ROOT_FOLDER_NAME:
-                child_path: Path = Path(child.name)
-            else:
-                child_path: Path = path.joinpath(child.name)
+            child_path: Path = join_child(child.name)
             if ignore and self.ignore(child_path):
                 logger.debug("iCloud Drive %s ignore %s",
                              "root" if root else "trash",
                               child_path)
                 continue
 
-            if child.type == "folder":
-                cfi = ICloudFolderInfo(child)
-                self.add(path=child_path, _obj=cfi, _root=root)
-                logger.debug("icloud %s add folder %s %s",
-                             "root" if root else "trash",
-                              child_path, cfi)
-                if recursive:
-                    if executor is not None:
-                        future: Future = executor.submit(
-                            self.process_folder,
-                            root=root,
-                            path=child_path,
-                            recursive=recursive,
-                            ignore=ignore,
-                            executor=executor)
-                        futures.append(future)
-                    else:
-                        self.process_folder(
-                            root=root,
-                            path=child_path,
-                            recursive=recursive,
-                            ignore=ignore,
-                            executor=executor)
-            elif child.type == "file":
-                cfi = ICloudFileInfo(child)
-                self.add(path=child_path, _obj=cfi, _root=root)
-                logger.debug("icloud %s add file %s %s",
-                             "root" if root else "trash",
-                              child_path, cfi)
-            else:
+            info_class: type[ICloudFileInfo | ICloudFolderInfo] = (
+                ICloudTree._child_info_classes.get(child.type))
+            if info_class is None:
                 logger.debug("icloud %s did not process %s %s",
                              "root" if root else "trash",
                              child.type,
-                             path.joinpath(child.name))
+                             child_path)
+                continue
+            cfi = info_class(child)
+            additions[child_path] = cfi
+            logger.debug("icloud %s add %s %s %s",
+                         "root" if root else "trash",
+                         child.type, child_path, cfi)
+            if info_class is ICloudFolderInfo:
+                folders.append(child_path)
+
+        folders_added: int = len(folders)
+        files_added: int = len(additions) - folders_added
+        subfolders: list[Path] = folders if recursive else []
+
+        # one locked update per folder, subfolders must be in the tree before they are processed
+        _the_dict.update(additions)
+        with self._counts_lock:
+            if root:
+                self._file_count_root += files_added
+                self._folder_count_root += folders_added
+            else:
+                self._file_count_trash += files_added
+                self._folder_count_trash += folders_added
+
+        # the batch tasks are the prefetch: their requests are in flight while this worker
+        # goes on with the remaining folders of its own batch
+        for i in range(0, len(subfolders), constants.FOLDER_BATCH_SIZE):
+            batch: list[Path] = subfolders[i:i + constants.FOLDER_BATCH_SIZE]
+            if executor is not None:
+                future: Future = self._track(executor.submit(
+                    self._process_folder_batch,
+                    root=root,
+                    paths=batch,
+                    recursive=recursive,
+                    ignore=ignore,
+                    executor=executor))
+                futures.append(future)
+            else:
+                self._process_folder_batch(
+                    root=root,
+                    paths=batch,
+                    recursive=recursive,
+                    ignore=ignore,
+                    executor=executor)
 
         return futures if len(futures) > 0 else result
 
+    def _process_folder_batch(self,
+                              root: bool,
+                              paths: list[Path],
+                              recursive: bool,
+                              ignore: bool,
+                              executor: ThreadPoolExecutor=None) -> list[Future]:
+        """
+        Fetch the children of a batch of sibling folders with one request, then
+        process the folders one after the other in this thread.
+        Returns the Future objects submitted for their subfolders.
+        """
+        _the_dict: ThreadSafePathDict = self._root if root else self._trash
+        futures: list[Future] = []
+        self._get_children_batch([cfi.node for cfi in _the_dict.bulk_get(paths)])
+        for path in paths:
+            result = self.process_folder(
+                root=root,
+                path=path,
+                recursive=recursive,
+                ignore=ignore,
+                executor=executor,
+                prefetched=True)
+            if isinstance(result, list):
+                futures.extend(result)
+        return futures
+
+    def _get_children_batch(self, nodes: list[DriveNode]) -> None:
+        """
+        Fetch the details of several folders with a single retrieveItemDetailsInFolders
+        request, the same endpoint DriveService.get_node_data calls for one folder.
+        The details are stored on each node's data so a following get_children()
+        builds the children without another request.
+        """
+        if not nodes:
+            return
+        response = self.drive.session.post(
+            self.drive.service_root + "/retrieveItemDetailsInFolders",
+            params=self.drive.params,
+            json=[{"drivewsid": node.data['drivewsid'], "partialData": False} for node in nodes])
+        # listings of large folders are big documents, orjson parses them several times faster
+        details: dict[str, dict] = {
+            item.get('drivewsid'): item for item in orjson.loads(response.content)}
+        for node in nodes:
+            data: dict = details.get(node.data['drivewsid'])
+            if data is not None:
+                node.data.update(data)
+
     def delete(self, path: Path, lfi: ICloudFileInfo, retry: int=constants.MAX_RETRIES) -> Delete:
         """
         Delete a file or folder from iCloud Drive.
         Updates the tree structure accordingly.
         Returns an Delete indicating success or failure."""
         result:ActionResult = Nil()
+        epoch: int = self._auth_epoch
         parent: ICloudFolderInfo = self._root.get(path.parent, None)
         cfi: ICloudFileInfo | ICloudFolderInfo = self._root.get(path, None)
         if parent is not None and cfi is not None:
@@ -326,7 +463,7 @@ class ICloudTree(BaseTree):
                                 exception=e)
             except Exception as e:
                 logger.error("exception in delete %s", e)
-                self._handle_drive_exception(e)
+                self._handle_drive_exception(e, epoch)
                 result = Delete(success=False,
                                 path=path,
                                 fn=self.delete,
@@ -341,6 +478,7 @@ class ICloudTree(BaseTree):
         Returns an Move indicating success or failure.
         """
         result: ActionResult = Nil()
+        epoch: int = self._auth_epoch
         try:
             cfi: ICloudFolderInfo | ICloudFileInfo = self._root.get(path, None)
             dfi: ICloudFolderInfo = self._root.get(dest_path.parent, None)
@@ -353,7 +491,7 @@ class ICloudTree(BaseTree):
                 result = Move(success=True, path=path, dest_path=dest_path)
         except Exception as e:
             logger.error("exception in move %s", e)
-            self._handle_drive_exception(e)
+            self._handle_drive_exception(e, epoch)
             result = Move(success=False,
                           path=path,
                           dest_path=dest_path,
@@ -369,6 +507,7 @@ class ICloudTree(BaseTree):
         Returns an Rename indicating success or failure.
         """
         result: ActionResult = Nil()
+        epoch: int = self._auth_epoch
         try:
             cfi: ICloudFolderInfo | ICloudFileInfo = self._root.get(old_path, None)
             if cfi is not None:
@@ -379,7 +518,7 @@ class ICloudTree(BaseTree):
                 result = Rename(success=True, path=new_path)
         except Exception as e:
             logger.error("exception in rename %s", e)
-            self._handle_drive_exception(e)
+            self._handle_drive_exception(e, epoch)
             result = Rename(success=False,
                             path=old_path,
                             fn=self.rename,
@@ -393,6 +532,7 @@ class ICloudTree(BaseTree):
         Preserves file metadata such as modification and creation times.
         Returns an Upload indicating success or failure."""
         result: ActionResult = Nil()
+        epoch: int = self._auth_epoch
         try:
             self.delete(path=path, lfi=lfi, retry=0)
             parent_path: Path = path.parent
@@ -410,7 +550,7 @@ class ICloudTree(BaseTree):
                             args=[path, lfi, 0])
         except Exception as e:
             logger.error("exception in upload %s", e)
-            self._handle_drive_exception(e)
+            self._handle_drive_exception(e, epoch)
             result = Upload(success=False,
                             path=path,
                             fn=self.upload,
@@ -426,25 +566,33 @@ class ICloudTree(BaseTree):
         Download a file from iCloud Drive.
         Preserves file metadata such as modification and creation times.
         Calls apply_after callback after successful download.
+        Skips the transfer if the local file already has the iCloud size and modified time.
         Returns an Download indicating success or failure.
         """
         result: ActionResult = Nil()
+        epoch: int = self._auth_epoch
         try:
             file_path: Path = self._root_path.joinpath(path)
-            parent_path: Path = path.parent
-            #os.makedirs(os.path.join(self._root_path, parent_path), exist_ok=True)
-            self._root_path.joinpath(parent_path).mkdir(parents=True, exist_ok=True)
-
-            with open(file_path, 'wb', buffering=0) as f:
+            if self._is_downloaded(file_path, cfi):
+                logger.debug("%s is up to date, skipping download", path)
+                apply_after(path)
+                return Download(success=True, path=path)
+            # buffered so short reads from the socket are coalesced into chunk sized writes,
+            # closing the file flushes it, there is no need to wait on the disk with fsync
+            # pylint: disable=consider-using-with
+            try:
+                f = open(file_path, 'wb', buffering=constants.DOWNLOAD_MEDIA_CHUNK_SIZE)
+            except FileNotFoundError:
+                # the folder is usually there already, only create it when the open fails
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                f = open(file_path, 'wb', buffering=constants.DOWNLOAD_MEDIA_CHUNK_SIZE)
+            with f:
                 with cfi.node.open(stream=True) as response:
                     for chunk in response.iter_content(
                         chunk_size=constants.DOWNLOAD_MEDIA_CHUNK_SIZE
                         ):
                         if chunk:
                             f.write(chunk)
-                f.flush()
-                os.fsync(f.fileno())
-                f.close()
 
             logger.debug("setting %s modified_time to %s", file_path, cfi.modified_time)
             os.utime(file_path, (cfi.modified_time.timestamp(), cfi.modified_time.timestamp()))
@@ -452,7 +600,7 @@ class ICloudTree(BaseTree):
             result = Download(success=True, path=path)
         except Exception as e:
             logger.error("exception in download %s", e)
-            self._handle_drive_exception(e)
+            self._handle_drive_exception(e, epoch)
             result = Download(success=False,
                               path=path,
                               fn=self.download,
@@ -460,11 +608,23 @@ class ICloudTree(BaseTree):
                               exception=e)
         return result
 
+    def _is_downloaded(self, file_path: Path, cfi: ICloudFileInfo) -> bool:
+        """
+        Return True if file_path exists and matches the size and modified time of cfi,
+        compared the same way as local and iCloud files are compared when syncing.
+        """
+        try:
+            lfi: LocalFileInfo = LocalFileInfo(name=file_path.name, stat_entry=file_path.stat())
+        except OSError:
+            return False
+        return lfi.size == cfi.size and lfi.modified_time == cfi.modified_time
+
     def create_icloud_folders(self, path: Path, retry: int=constants.MAX_RETRIES) -> MkDir | Nil:
         """
         Create intermediate folders in iCloud Drive for the given path.
         Returns a MkDir or Nil indicating success or failure."""
         result: ActionResult = None
+        epoch: int = self._auth_epoch
         try:
             folder_path = BaseTree.ROOT_FOLDER_NAME
             _path: Path = folder_path
@@ -489,7 +649,7 @@ class ICloudTree(BaseTree):
                 result = Nil()
         except Exception as e:
             logger.error("exception in create_icloud_folders %s", e)
-            self._handle_drive_exception(e)
+            self._handle_drive_exception(e, epoch)
             result = MkDir(success=False,
                            path=path,
                            fn=self.create_icloud_folders,
@@ -577,30 +737,40 @@ class ICloudTree(BaseTree):
             return False
         return pre_count != post_count
 
-    def _handle_drive_exception(self, e: Exception) -> None:
+    def _handle_drive_exception(self, e: Exception, epoch: int=None) -> None:
         """
         Handle exceptions raised during iCloud Drive operations.
         Categorizes exceptions and logs appropriate messages.
-        Clears authentication state on API failures to force re-authentication."""
+        Clears authentication state on API failures to force re-authentication.
+        epoch is the authentication epoch the failing operation started with, if it
+        is stale another thread has already re-authenticated and the state is kept."""
         match e:
             case PyiCloudAPIResponseException():
                 logger.error("exception PyiCloudAPIResponseException: %s %s code: %s",
                                e.__class__.__name__, e, e.code)
                 if e.code is not None and e.code in [503,]:
                     logger.warning(traceback.format_exc())
-                self._is_authenticated: bool = False
+                self._invalidate_authentication(epoch)
                 logger.info("pausing jobs")
                 self.ctx.jobs_disabled.set()
             case PyiCloudFailedLoginException():
                 logger.error("exception PyiCloudFailedLoginException: %s %s",
                                e.__class__.__name__, e)
                 logger.warning(traceback.format_exc())
-                self._is_authenticated: bool = False
+                self._invalidate_authentication(epoch)
                 logger.info("pausing jobs")
                 self.ctx.jobs_disabled.set()
             case _:
                 logger.critical("unhandled exception in ICloudTree: %s %s", e.__class__.__name__, e)
                 logger.error(traceback.format_exc())
-                self._is_authenticated: bool = False
+                self._invalidate_authentication(epoch)
                 logger.info("pausing jobs")
                 self.ctx.jobs_disabled.set()
+
+    def _invalidate_authentication(self, epoch: int=None) -> None:
+        """
+        Clear the authentication state, unless a newer login happened after epoch.
+        """
+        with self._auth_lock:
+            if epoch is None or epoch == self._auth_epoch:
+                self._is_authenticated: bool = False
@@ -7,8 +7,10 @@ with support for ignore/include filtering rules.
 """
 from os import scandir, stat_result
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 import logging
 from typing import override
+from concurrent.futures import ThreadPoolExecutor
 
 from context import Context
 from model.base_tree import BaseTree
@@ -38,6 +40,8 @@ class LocalTree(BaseTree):
 
     3. REFRESH OPERATION:
     - Scans the entire local file system tree recursively
+    - Folders are scanned concurrently on a ThreadPoolExecutor (--max-workers), one task
+      per folder, and refresh waits until no task is left in flight
     - Initializes the root folder node if not already present
     - Calls _add_children to recursively populate files and directories
     - Applies ignore/include rules to filter out unwanted items
@@ -54,7 +58,7 @@ class LocalTree(BaseTree):
     - Uses os.scandir() for efficient directory scanning
     - Processes both files and directories, applying ignore filters
     - Handles permission errors gracefully by skipping unreadable directories
-    - Converts absolute paths to relative paths for tree storage
+    - Builds relative paths for tree storage from the parent's relative path
 
     6. IGNORE/INCLUDE FILTERING:
     - Applies filtering rules during both refresh and add operations
@@ -90,12 +94,24 @@ class LocalTree(BaseTree):
         self._root.clear()
         self._root[BaseTree.ROOT_FOLDER_NAME] = LocalFolderInfo(
             BaseTree.ROOT_FOLDER_NAME)
-        self._add_children(self._root_path)
+        with ThreadPoolExecutor(
+            thread_name_prefix='local',
+            max_workers=self.ctx.max_workers) as executor:
+            self._walk_errors.clear()
+            self._track(executor.submit(self._add_children, self._root_path, executor=executor))
+            # every task registers its subfolder tasks before it finishes itself,
+            # so the count only reaches zero once the whole scan is done
+            self._walk_done.wait()
+            if self._walk_errors:
+                raise self._walk_errors[0]
         self._remove_ignored_items()
-        logger.debug("refresh local complete root has %d items, %d folders, %d files",
-                     len(self._root),
-                     sum(1 for _ in self.folders(root=True)),
-                     sum(1 for _ in self.files(root=True)))
+        if logger.isEnabledFor(logging.DEBUG):
+            # one pass over the tree, and only when the counts are going to be logged
+            folders: int = sum(1 for v in self._root.values() if isinstance(v, LocalFolderInfo))
+            logger.debug("refresh local complete root has %d items, %d folders, %d files",
+                         len(self._root),
+                         folders,
+                         len(self._root) - folders)
 
     @override
     def add(self,
@@ -106,19 +122,29 @@ class LocalTree(BaseTree):
 
         root = self._root if _root is None else _root
 
+        # parents are added top down, so once one is present all of its parents are too
+        missing: list[Path] = []
         for parent in path.parents:
-            if parent.name and parent not in self._root:
-                root[parent] = LocalFolderInfo(name=parent.name)
+            if not parent.name or parent in root:
+                break
+            missing.append(parent)
+        for parent in reversed(missing):
+            root[parent] = LocalFolderInfo(name=parent.name)
 
         if _obj is not None:
             root[path] = _obj
         else:
-            if self._root_path.joinpath(path).is_file():
+            # a single stat tells file from folder and gives the file's size and times
+            stat_entry: stat_result = None
+            try:
+                stat_entry = self._root_path.joinpath(path).stat()
+            except OSError:
+                pass
+            if stat_entry is not None and S_ISREG(stat_entry.st_mode):
                 # add file entry
-                stat_entry: stat_result = self._root_path.joinpath(path).stat()
                 root[path] = LocalFileInfo(
                     name=path.name, stat_entry=stat_entry)
-            elif self._root_path.joinpath(path).is_dir():
+            elif stat_entry is not None and S_ISDIR(stat_entry.st_mode):
                 # add folder entry
                 root[path] = LocalFolderInfo(path.name)
             elif path in self._root:
@@ -126,29 +152,43 @@ class LocalTree(BaseTree):
                 root.pop(path)
         return root.get(path, None)
 
-    def _add_children(self, path: Path) -> None:
-        """Populate files and subfolders for a single folder."""
+    def _add_children(self, path: Path,
+                      relative_path: Path=BaseTree.ROOT_FOLDER_NAME,
+                      executor: ThreadPoolExecutor=None) -> None:
+        """
+        Populate files and subfolders for a single folder.
+        relative_path is path relative to the root path, child paths are built from it
+        rather than by making every entry's absolute path relative again.
+        Subfolders are scanned on executor when given, else recursively in this thread.
+        """
+        subfolders: list[tuple[str, Path]] = []
         try:
             with scandir(path) as entries:
                 for entry in entries:
-                    path = Path(entry.path).relative_to(self._root_path)
-                    stat_entry = entry.stat()
+                    path = relative_path.joinpath(entry.name)
+                    # is_dir/is_file use the d_type from scandir unless the entry is a
+                    # symlink, only files need a stat() for their size and times
                     if entry.is_dir(follow_symlinks=True):
                         if self.ignore(path):
                             logger.debug("local ignore folder %s", path)
-                            self._add_children(entry.path)
                         else:
                             lfi = LocalFolderInfo(name=entry.name)
                             self.add(path=path, _obj=lfi)
                             logger.debug("local add folder %s %s", path, lfi)
-                            self._add_children(entry.path)
+                        subfolders.append((entry.path, path))
                     elif entry.is_file(follow_symlinks=True):
                         if self.ignore(path):
                             logger.debug("local ignore file %s", path)
                             continue
-                        lfi = LocalFileInfo(name=entry.name, stat_entry=stat_entry)
+                        lfi = LocalFileInfo(name=entry.name, stat_entry=entry.stat())
                         self.add(path=path, _obj=lfi)
                         logger.debug("local add folder %s", path)
 
         except PermissionError:
             pass  # Skip unreadable directories
+
+        for entry_path, path in subfolders:
+            if executor is not None:
+                self._track(executor.submit(self._add_children, entry_path, path, executor))
+            else:
+                self._add_children(entry_path, path)
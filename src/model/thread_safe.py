@@ -4,49 +4,127 @@ Provides lightweight thread-safe wrappers around dict, list, and set
 behaviors used elsewhere in the project. These wrappers use reentrant locks
 to ensure safe concurrent access and support context-manager locking for
 batch operations.
+
+Readers take the same lock as writers. Each critical section is a single
+dict, list or set operation, which is shorter than the extra acquire and
+release a Condition based reader-writer lock would add to every call.
+Locks are acquired blocking, spinning on acquire(blocking=False) would hold
+the GIL that the owner of the lock needs to finish and release it.
+The module stays pure Python, icloudds is built as a pure wheel and the
+containers guard trees filled by network bound work.
+
+Nothing here relies on the GIL for correctness, so the containers work
+unchanged on free-threaded builds. threading.RLock is already backed by
+PyMutex there, and the unsafe_* readers rely only on a single built-in
+dict or set operation being atomic, which free-threaded CPython keeps
+with per-object locks.
 """
 from threading import RLock
 from pathlib import Path
-from collections import UserDict, UserList
-from typing import Union, Any, Iterator, Tuple, Iterable, Set
+from collections import Counter
+from collections.abc import MutableMapping, MutableSequence
+from functools import lru_cache
+from typing import Union, Any, Iterator, Tuple, Iterable, Set, FrozenSet
+
+
+@lru_cache(maxsize=4096)
+def _path_str(value: Union[str, Path]) -> str:
+    """Normalized string form of a path, cached as the same paths recur."""
+    return str(Path(value))
+
 
-class ThreadSafePathDict(UserDict):
+class ThreadSafePathDict(MutableMapping):
     """
     A thread-safe dict using RLock that accepts str or Path objects 
     as indices by normalizing them to a standard string representation.
+    A single lock guards the whole dict rather than one per shard, 'with d:'
+    blocks and key snapshots need all of it at once.
+    Wraps a plain dict in self.data instead of subclassing UserDict, so each
+    accessor is a single method call around the dict operation.
     """
+    __slots__ = ('_lock', '_keys_snapshot', 'data')
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, other=None, /, **kwargs):
         self._lock = RLock()
-        super().__init__(*args, **kwargs)
-
-    def _normalize(self, key: Union[str, Path]) -> str:
+        # keys as of the last change, built by __iter__ and dropped by every mutator
+        self._keys_snapshot: Tuple[Path, ...] = None
+        self.data: dict[Path, Any] = {}
+        if other is not None or kwargs:
+            self.update(other, **kwargs)
+
+    def _normalize(self, key: Union[str, Path]) -> Path:
+        # keys are nearly always Paths already, Path(key) would copy them and
+        # lose the hash they have cached
+        if isinstance(key, Path):
+            return key
         return Path(key)
 
     # accessor methods
+    # get, pop and update work on self.data directly, the MutableMapping versions
+    # go back through the locked accessors and take the lock once per key
     def get(self, key, default=None):
+        key = self._normalize(key)
         with self._lock:
-            return super().get(self._normalize(key), default)
+            return self.data.get(key, default)
+
+    def setdefault(self, key, default=None):
+        """
+        Return the value for key, inserting default first if key is missing.
+        The lookup and insert happen under one acquisition, the MutableMapping
+        version takes the lock twice and two threads could both insert.
+        The lock is needed to drop the key snapshot along with the insert.
+        """
+        key = self._normalize(key)
+        with self._lock:
+            if key not in self.data:
+                self._keys_snapshot = None
+            return self.data.setdefault(key, default)
 
     def pop(self, key, default=None):
+        key = self._normalize(key)
         with self._lock:
-            return super().pop(self._normalize(key), default)
+            self._keys_snapshot = None
+            return self.data.pop(key, default)
 
     def update(self, other=None, **kwargs):  # pylint: disable=arguments-differ
         """Update mapping with another mapping or iterable and/or keyword args.
         Uses the same signature as the built-in `dict.update(other=None, **kwargs)`
         to avoid Pylint W0221 (arguments-differ) when overriding.
+        Keys are normalized before the lock is taken, the lock is taken once.
         """
+        items = dict(other or (), **kwargs)
+        normalized = {self._normalize(k): v for k, v in items.items()}
         with self._lock:
-            if other is None:
-                # Only keyword args provided
-                super().update(**kwargs)
-            else:
-                super().update(other, **kwargs)
+            self._keys_snapshot = None
+            self.data.update(normalized)
+
+    def bulk_get(self, keys: Iterable[Union[str, Path]], default=None) -> list[Any]:
+        """
+        Get the values of several keys, in order, taking the lock once.
+        Prefer this to a loop of get() when the keys are known in advance.
+        """
+        normalized = [self._normalize(k) for k in keys]
+        with self._lock:
+            return [self.data.get(k, default) for k in normalized]
+
+    def bulk_pop(self, keys: Iterable[Union[str, Path]], default=None) -> list[Any]:
+        """
+        Pop several keys, in order, taking the lock once.
+        Prefer this to a loop of pop() when the keys are known in advance.
+        """
+        normalized = [self._normalize(k) for k in keys]
+        with self._lock:
+            self._keys_snapshot = None
+            return [self.data.pop(k, default) for k in normalized]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
 
     def clear(self):
         with self._lock:
-            super().clear()
+            self._keys_snapshot = None
+            self.data.clear()
 
     # --- Context Manager Methods ---
     def __enter__(self):
@@ -59,47 +137,73 @@ class ThreadSafePathDict(UserDict):
 
     # --- Thread-Safe Accessors ---
     def __getitem__(self, key: Union[str, Path]) -> Any:
+        key = self._normalize(key)
         with self._lock:
-            return super().__getitem__(self._normalize(key))
+            return self.data[key]
 
     def __setitem__(self, key: Union[str, Path], value: Any) -> None:
+        key = self._normalize(key)
         with self._lock:
-            super().__setitem__(self._normalize(key), value)
+            self._keys_snapshot = None
+            self.data[key] = value
 
     def __delitem__(self, key: Union[str, Path]) -> None:
         with self._lock:
-            super().__delitem__(self._normalize(key))
+            self._keys_snapshot = None
+            del self.data[self._normalize(key)]
 
     def __contains__(self, key):
+        key = self._normalize(key)
         with self._lock:
-            return super().__contains__(self._normalize(key))
+            return key in self.data
 
     def __len__(self):
         with self._lock:
-            return super().__len__()
+            return len(self.data)
 
     def unsafe_len(self):
         """Return the length without acquiring the lock (fast, potentially racy)."""
-        return super().__len__()
+        return len(self.data)
+
+    def unsafe_contains(self, key) -> bool:
+        """
+        Check membership without acquiring the lock (fast, potentially racy).
+        A single dict lookup cannot see a torn dict, but may miss a concurrent change.
+        """
+        return self._normalize(key) in self.data
+
+    def unsafe_get(self, key, default=None) -> Any:
+        """
+        Get without acquiring the lock (fast, potentially racy).
+        A single dict lookup cannot see a torn dict, but may miss a concurrent change.
+        """
+        return self.data.get(self._normalize(key), default)
 
     # --- Iterator Methods (Snapshotting) ---
     def __iter__(self) -> Iterator[str]:
-        """Iterates over a copy of keys to remain thread-safe."""
-        with self._lock:
-            return iter(list(self.data.keys()))
+        """
+        Iterates over an immutable snapshot of the keys to remain thread-safe.
+        The snapshot is shared until the next change, only then is it copied again.
+        """
+        snapshot = self._keys_snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._keys_snapshot = tuple(self.data)
+        return iter(snapshot)
 
-    def keys(self):
+    # keys, values and items return immutable snapshots taken under the lock
+    def keys(self) -> FrozenSet[Path]:
         with self._lock:
-            # Returns a snapshot set to support set operations
-            return set(self.data.keys())
+            # Returns a snapshot frozenset to support set operations
+            return frozenset(self.data)
 
-    def values(self) -> Iterator[Any]:
+    def values(self) -> Tuple[Any, ...]:
         with self._lock:
-            return iter(list(self.data.values()))
+            return tuple(self.data.values())
 
-    def items(self) -> Iterator[Tuple[str, Any]]:
+    def items(self) -> Tuple[Tuple[Path, Any], ...]:
         with self._lock:
-            return iter(list(self.data.items()))
+            return tuple(self.data.items())
 
      # --- Set Operation Support ---
     def __or__(self, other: Union[dict, 'ThreadSafePathDict']) -> 'ThreadSafePathDict':
@@ -115,91 +219,150 @@ class ThreadSafePathDict(UserDict):
         # Normalize the other keys first
         other_keys = {self._normalize(k) for k in other}
         with self._lock:
-            return set(self.data.keys()) & other_keys
+            return self.data.keys() & other_keys
 
     def __sub__(self, other: Iterable[Any]) -> Set[str]:
         """Difference: Returns a set of keys in self but NOT in other."""
         other_keys = {self._normalize(k) for k in other}
         with self._lock:
-            return set(self.data.keys()) - other_keys
+            return self.data.keys() - other_keys
 
     def __xor__(self, other: Iterable[Any]) -> Set[str]:
         """Symmetric Difference: Keys in either self or other, but not both."""
         other_keys = {self._normalize(k) for k in other}
         with self._lock:
-            return set(self.data.keys()) ^ other_keys
+            return self.data.keys() ^ other_keys
 
     def __repr__(self):
+        # copy under the lock, format the entries outside of it
         with self._lock:
-            return f"ThreadSafeDict({super().__repr__()})"
+            snapshot = dict(self.data)
+        return f"ThreadSafeDict({snapshot!r})"
 
 
-class ThreadSafePathList(UserList):
+class ThreadSafePathList(MutableSequence):
     """
     A thread-safe list using RLock that accepts str or Path objects 
     as indices by normalizing them to a standard string representation.
+    Wraps a plain list in self.data instead of subclassing UserList.
+    A count of each item is kept next to the list, so looking up or
+    checking for a path does not scan the list.
     """
-    def __init__(self, *args, **kwargs):
+    __slots__ = ('_lock', '_snapshot', 'data', '_counts')
+
+    def __init__(self, initlist: Iterable[Any]=None):
         self._lock = RLock()
-        super().__init__(*args, **kwargs)
+        # items as of the last change, built by __iter__ and dropped by every mutator
+        self._snapshot: Tuple[Any, ...] = None
+        self.data: list[Any] = [self._normalize(i) for i in initlist or ()]
+        self._counts: Counter = Counter(self.data)
 
-    def _normalize(self, value: Any) -> Any:
-        """Helper to ensure paths are stored consistently as Paths."""
-        return str(Path(value))
+    # ensures paths are stored consistently, bound directly to save a call
+    _normalize = staticmethod(_path_str)
+
+    def _discard(self, items: Iterable[Any]) -> None:
+        """Drop items removed from self.data from the counts, with the lock held."""
+        for item in items:
+            self._counts[item] -= 1
+            if self._counts[item] == 0:
+                del self._counts[item]
 
     # --- Core Indexing Methods ---
     def __getitem__(self, index: Union[int, str, Path, slice]) -> Any:
         with self._lock:
             if isinstance(index, (str, Path)):
                 target = self._normalize(index)
-                try:
-                    return self.data[self.data.index(target)]
-                except ValueError as e:
-                    raise KeyError(f"path {index} not found in list.") from e
-            return super().__getitem__(index)
+                if target not in self._counts:
+                    raise KeyError(f"path {index} not found in list.")
+                # the item stored for a path is its normalized form
+                return target
+            return self.data[index]
 
     def __setitem__(self, index: int, item: Any) -> None:
         """Normalizes the item before setting it at the specified index."""
+        item = self._normalize(item)
         with self._lock:
-            super().__setitem__(index, self._normalize(item))
+            self._snapshot = None
+            self._discard([self.data[index]])
+            self.data[index] = item
+            self._counts[item] += 1
 
     def __delitem__(self, index: Union[int, str, Path, slice]) -> None:
         """Deletes item by integer index or by path search."""
         with self._lock:
+            self._snapshot = None
             if isinstance(index, (str, Path)):
                 target = self._normalize(index)
-                try:
-                    self.data.remove(target)
-                except ValueError as e:
-                    raise KeyError(f"path {index} not found in list.") from e
+                if target not in self._counts:
+                    raise KeyError(f"path {index} not found in list.")
+                self.data.remove(target)
+                self._discard([target])
             else:
-                super().__delitem__(index)
+                removed = self.data[index]
+                del self.data[index]
+                self._discard(removed if isinstance(index, slice) else [removed])
 
     # --- Mutators ---
     def append(self, item: Any) -> None:
+        item = self._normalize(item)
         with self._lock:
-            self.data.append(self._normalize(item))
+            self._snapshot = None
+            self.data.append(item)
+            self._counts[item] += 1
 
     def extend(self, other: Iterable[Any]) -> None:
         normalized = [self._normalize(i) for i in other]
         with self._lock:
+            self._snapshot = None
             self.data.extend(normalized)
+            self._counts.update(normalized)
+
+    def __iadd__(self, other: Iterable[Any]):
+        self.extend(other)
+        return self
 
     def insert(self, i: int, item: Any) -> None:
         """Insert normalized item at index i."""
+        item = self._normalize(item)
         with self._lock:
-            self.data.insert(i, self._normalize(item))
+            self._snapshot = None
+            self.data.insert(i, item)
+            self._counts[item] += 1
 
     def pop(self, i: int = -1) -> Any:
         """Remove and return item at index i (default last)."""
         with self._lock:
-            return self.data.pop(i)
+            self._snapshot = None
+            item = self.data.pop(i)
+            self._discard([item])
+            return item
 
     def remove(self, item: Any) -> None:
         """Remove the first occurrence of the (normalized) item."""
         target = self._normalize(item)
         with self._lock:
+            self._snapshot = None
             self.data.remove(target)
+            self._discard([target])
+
+    def clear(self) -> None:
+        """Remove all items."""
+        with self._lock:
+            self._snapshot = None
+            self.data.clear()
+            self._counts.clear()
+
+    def sort(self, /, *args, **kwds) -> None:
+        """Sort the list in place."""
+        with self._lock:
+            self._snapshot = None
+            self.data.sort(*args, **kwds)
+
+    def reverse(self) -> None:
+        """Reverse the list in place."""
+        with self._lock:
+            self._snapshot = None
+            self.data.reverse()
 
     # --- Context Manager ---
     def __enter__(self):
@@ -211,49 +374,78 @@ class ThreadSafePathList(UserList):
 
     # --- Iteration ---
     def __iter__(self):
-        """Return an iterator over a snapshot of the list (does not hold the lock)."""
-        with self._lock:
-            return iter(list(self.data))
+        """
+        Return an iterator over an immutable snapshot of the list (does not hold the lock).
+        The snapshot is shared until the next change, only then is it copied again.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot = tuple(self.data)
+        return iter(snapshot)
 
     def __len__(self):
         """Return the number of items in the list (thread-safe)."""
         with self._lock:
-            return super().__len__()
+            return len(self.data)
 
     def unsafe_len(self):
         """Return the length without acquiring the lock (fast, potentially racy)."""
-        return super().__len__()
+        return len(self.data)
 
     def __contains__(self, item):
         """Check if an item is in the list (thread-safe)."""
         with self._lock:
-            return item in self.data
+            return item in self._counts
 
     def __repr__(self):
         """Return a thread-safe string representation of the list."""
         with self._lock:
-            return f"ThreadSafeList({super().__repr__()})"
+            snapshot = list(self.data)
+        return f"ThreadSafeList({snapshot!r})"
+
+    def __eq__(self, other):
+        """Compare the items with a list, or another ThreadSafePathList (thread-safe)."""
+        if isinstance(other, ThreadSafePathList):
+            other = list(other)
+        with self._lock:
+            return self.data == other
+
+    def copy(self) -> ThreadSafePathList:
+        """Return a new ThreadSafePathList with the same items."""
+        return self.__class__(self)
 
 
 class ThreadSafeSet:
-    """A thread-safe set implementation using a threading.Lock."""
+    """
+    A thread-safe set implementation using a threading.RLock.
+    Membership checks go to the set itself rather than a per-thread cache,
+    checking a thread-local cache for staleness costs as much as the locked lookup.
+    """
+    __slots__ = ('_set', '_lock', '_snapshot')
+
     def __init__(self, initial_data=None):
         self._set = set(initial_data if initial_data is not None else [])
         self._lock = RLock()
+        # items as of the last change, built by __iter__ and dropped by every mutator
+        self._snapshot: FrozenSet[Any] = None
 
     def add(self, item):
         """Add an item to the set in a thread-safe manner."""
         with self._lock:
+            self._snapshot = None
             self._set.add(item)
 
     def remove(self, item):
         """Remove an item from the set in a thread-safe manner."""
         with self._lock:
+            self._snapshot = None
             self._set.remove(item)
 
     def update(self, *others):
         """Update the set with one or more iterables in a thread-safe manner."""
         with self._lock:
+            self._snapshot = None
             self._set.update(*others)
 
     def __contains__(self, item):
@@ -264,6 +456,7 @@ class ThreadSafeSet:
     def clear(self):
         """Remove all items from the set in a thread-safe manner."""
         with self._lock:
+            self._snapshot = None
             self._set.clear()
 
     def __len__(self):
@@ -275,11 +468,21 @@ class ThreadSafeSet:
         """Return the number of items in the set without locking."""
         return len(self._set)
 
+    def unsafe_contains(self, item) -> bool:
+        """Check if an item is in the set without locking (fast, potentially racy)."""
+        return item in self._set
+
     def __iter__(self):
-        """Return a thread-safe iterator over a copy of the set."""
-        with self._lock:
-            # Returns a snapshot so the loop can run without holding the lock
-            return iter(set(self._set))
+        """
+        Return a thread-safe iterator over a frozenset snapshot of the set.
+        The snapshot is shared until the next change, only then is it copied again.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                # a snapshot so the loop can run without holding the lock
+                snapshot = self._snapshot = frozenset(self._set)
+        return iter(snapshot)
 
     def __enter__(self):
         """Enables context manager support for manual locking blocks."""
@@ -293,4 +496,5 @@ class ThreadSafeSet:
     def __repr__(self):
         """Return a thread-safe string representation of the set."""
         with self._lock:
-            return f"ThreadSafeSet({self._set!r})"
+            snapshot = set(self._set)
+        return f"ThreadSafeSet({snapshot!r})"